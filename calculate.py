@@ -4,6 +4,12 @@ from pathlib import Path
 
 from fastmcp import FastMCP
 
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -14,6 +20,11 @@ config = load_server_config("math")
 mcp = FastMCP("Math")
 
 
+# 0! .. 170!; math.factorial only tables up to 20! and multiplies out the rest per call
+_FACT_SMALL_SIZE = 171
+_FACT_SMALL = tuple(math.factorial(i) for i in range(_FACT_SMALL_SIZE))
+
+
 # ----------------- Basic Float Operations -----------------
 @mcp.tool()
 def add(a: float, b: float) -> float:
@@ -53,6 +64,9 @@ def sqrt(a: float) -> float:
 def factorial(a: int) -> int:
     if a < 0:
         raise ValueError("Factorial is not defined for negative numbers.")
+    if a < _FACT_SMALL_SIZE:
+        return _FACT_SMALL[a]
+    # math.factorial already does divide-and-conquer binary splitting in C
     return math.factorial(a)
 
 
@@ -67,6 +81,8 @@ def int_divide(a: int, b: int) -> int:
     """Integer division"""
     if b == 0:
         raise ValueError("Division by zero is not allowed.")
+    if b > 0 and not b & (b - 1):
+        return a >> (b.bit_length() - 1)
     return a // b
 
 
@@ -75,6 +91,8 @@ def modulo(a: int, b: int) -> int:
     """Modulo (remainder)"""
     if b == 0:
         raise ValueError("Modulo by zero is not allowed.")
+    if b > 0 and not b & (b - 1):
+        return a & (b - 1)
     return a % b
 
 
@@ -87,9 +105,47 @@ def gcd(a: int, b: int) -> int:
 @mcp.tool()
 def lcm(a: int, b: int) -> int:
     """Least common multiple"""
-    if a == 0 or b == 0:
-        return 0
-    return abs(a * b) // math.gcd(a, b)
+    return math.lcm(a, b)
+
+
+def _kary_powmod(base, exponent: int, mod, k: int = 5):
+    """
+    Left-to-right sliding-window modular exponentiation.
+    Pure-Python fallback for operands that support * and % but not three-argument pow().
+    """
+    if exponent == 0:
+        return 1 % mod
+
+    # odd_powers[i] holds base ** (2 * i + 1) % mod
+    base %= mod
+    base_sq = base * base % mod
+    odd_powers = [base] * (1 << (k - 1))
+    for i in range(1, len(odd_powers)):
+        odd_powers[i] = odd_powers[i - 1] * base_sq % mod
+
+    result = None
+    i = exponent.bit_length() - 1
+    while i >= 0:
+        if not (exponent >> i) & 1:
+            result = result * result % mod
+            i -= 1
+            continue
+
+        # Widest window of at most k bits that starts and ends on a set bit
+        j = max(i - k + 1, 0)
+        while not (exponent >> j) & 1:
+            j += 1
+        window = (exponent >> j) & ((1 << (i - j + 1)) - 1)
+
+        if result is None:
+            result = odd_powers[window >> 1]
+        else:
+            for _ in range(i - j + 1):
+                result = result * result % mod
+            result = result * odd_powers[window >> 1] % mod
+        i = j - 1
+
+    return result
 
 
 @mcp.tool()
@@ -101,21 +157,13 @@ def fast_power(base: int, exponent: int, mod: int = None) -> int:
     if exponent < 0:
         raise ValueError("Exponent must be non-negative for fast_power.")
 
-    result = 1
-    b = base
-    e = exponent
-
-    while e > 0:
-        if e % 2 == 1:
-            result *= b
-            if mod is not None:
-                result %= mod
-        b *= b
-        if mod is not None:
-            b %= mod
-        e //= 2
-
-    return result
+    try:
+        return pow(base, exponent, mod)
+    except TypeError:
+        # Only int exponents can be windowed; anything else keeps pow()'s error
+        if mod is None or not isinstance(exponent, int):
+            raise
+        return _kary_powmod(base, exponent, mod)
 
 
 @mcp.tool()
@@ -143,13 +191,126 @@ def bit_right_shift(a: int, b: int) -> int:
     return a >> b
 
 
+# ----------------- Batch Operations -----------------
+# Each tool call pays the full JSON + dispatch round trip, so these variants
+# apply one operation element-wise across whole lists in a single call.
+def _check_same_length(a: list, b: list) -> None:
+    if len(a) != len(b):
+        raise ValueError(f"Batch inputs must have the same length ({len(a)} != {len(b)}).")
+
+
+@mcp.tool()
+def add_batch(a: list[float], b: list[float]) -> list[float]:
+    """Element-wise addition"""
+    _check_same_length(a, b)
+    return [x + y for x, y in zip(a, b)]
+
+
+@mcp.tool()
+def subtract_batch(a: list[float], b: list[float]) -> list[float]:
+    """Element-wise subtraction"""
+    _check_same_length(a, b)
+    return [x - y for x, y in zip(a, b)]
+
+
+@mcp.tool()
+def multiply_batch(a: list[float], b: list[float]) -> list[float]:
+    """Element-wise multiplication"""
+    _check_same_length(a, b)
+    return [x * y for x, y in zip(a, b)]
+
+
+@mcp.tool()
+def divide_batch(a: list[float], b: list[float]) -> list[float]:
+    """Element-wise division"""
+    _check_same_length(a, b)
+    if 0 in b:
+        raise ValueError("Division by zero is not allowed.")
+    return [x / y for x, y in zip(a, b)]
+
+
+@mcp.tool()
+def power_batch(a: list[float], b: list[float]) -> list[float]:
+    """Element-wise power"""
+    _check_same_length(a, b)
+    return [x**y for x, y in zip(a, b)]
+
+
+@mcp.tool()
+def gcd_batch(a: list[int], b: list[int]) -> list[int]:
+    """Element-wise greatest common divisor"""
+    _check_same_length(a, b)
+    return list(map(math.gcd, a, b))
+
+
+@mcp.tool()
+def lcm_batch(a: list[int], b: list[int]) -> list[int]:
+    """Element-wise least common multiple"""
+    _check_same_length(a, b)
+    return list(map(math.lcm, a, b))
+
+
+@mcp.tool()
+def fast_power_batch(bases: list[int], exponents: list[int], mod: int = None) -> list[int]:
+    """
+    Batch fast exponentiation.
+    Computes (base ** exponent) % mod for each pair, or base ** exponent if mod is None.
+    """
+    _check_same_length(bases, exponents)
+    if any(e < 0 for e in exponents):
+        raise ValueError("Exponent must be non-negative for fast_power.")
+    return [pow(b, e, mod) for b, e in zip(bases, exponents)]
+
+
+# Largest modulus whose residues can be multiplied without overflowing int64
+_INT64_KERNEL_MAX_MOD = math.isqrt(2**63 - 1) + 1
+_INT64_MAX = 2**63 - 1
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _fast_power_kernel_u64(bases, exps, mod):
+        out = np.empty_like(bases)
+        for i in numba.prange(bases.shape[0]):
+            result = 1 % mod
+            b = bases[i]
+            e = exps[i]
+            while e > 0:
+                if e & 1:
+                    result = result * b % mod
+                b = b * b % mod
+                e >>= 1
+            out[i] = result
+        return out
+
+
+@mcp.tool()
+def fast_power_batch_u64(bases: list[int], exponents: list[int], mod: int) -> list[int]:
+    """
+    Batch modular exponentiation compiled to native code with Numba.
+    Falls back to pow() when Numba is unavailable or the inputs do not fit the int64 kernel.
+    """
+    _check_same_length(bases, exponents)
+    if any(e < 0 for e in exponents):
+        raise ValueError("Exponent must be non-negative for fast_power.")
+    if mod == 0:
+        raise ValueError("Modulo by zero is not allowed.")
+
+    if numba is None or not 0 < mod <= _INT64_KERNEL_MAX_MOD or any(e > _INT64_MAX for e in exponents):
+        return [pow(b, e, mod) for b, e in zip(bases, exponents)]
+
+    # Reduce in Python first so arbitrary-size and negative bases become int64 residues
+    residues = np.array([b % mod for b in bases], dtype=np.int64)
+    return _fast_power_kernel_u64(residues, np.array(exponents, dtype=np.int64), mod).tolist()
+
+
 if __name__ == "__main__":
     # stdio transport doesn't need host/port
-    if config["transport"] == "stdio":
+    if config.transport == "stdio":
         mcp.run(transport="stdio")
     else:
         mcp.run(
-            transport=config["transport"],
-            host=config["host"],
-            port=config["port"],
+            transport=config.transport,
+            host=config.host,
+            port=config.port,
         )
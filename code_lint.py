@@ -1,9 +1,13 @@
+import json
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
 
 from fastmcp import FastMCP
 
@@ -16,36 +20,247 @@ from config_loader import load_server_config
 config = load_server_config("code_lint")
 mcp = FastMCP("CodeLint")
 
+# Filename reported for code linted from a string
+SNIPPET_NAME = "snippet.py"
+
+# Called with each linter subprocess right after it is spawned
+ProcessCallback = Callable[[subprocess.Popen], None]
+
+
+# Driver run inside the persistent pylint process. Requests and responses are
+# one JSON object per line; fd 1 is reserved for responses so stray prints from
+# pylint or plugins cannot corrupt the protocol.
+_PYLINT_WORKER_SCRIPT = """
+import json
+import os
+
+# Move fd 1 aside before anything else is imported, so import-time prints cannot pose as responses
+responses = os.fdopen(os.dup(1), "w")
+os.dup2(2, 1)
+
+import contextlib
+import io
+import sys
+import sysconfig
+
+from astroid import MANAGER
+from astroid.exceptions import AstroidBuildingError
+from astroid.interpreter._import import spec as astroid_spec
+from pylint.lint import Run
+from pylint.reporters.text import TextReporter
+
+args = json.loads(sys.argv[1])
+requests = sys.stdin
+cached_roots = tuple(
+    path for key, path in sysconfig.get_paths().items() if key in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+def respond(payload):
+    responses.write(json.dumps(payload) + "\\n")
+    responses.flush()
+
+
+def forget_user_modules():
+    # Keep stdlib/site-packages ASTs warm, but re-parse user code on every request
+    for name, module in list(MANAGER.astroid_cache.items()):
+        if module.file and not module.file.startswith(cached_roots):
+            del MANAGER.astroid_cache[name]
+    # Module lookups are cached separately, failures included; drop failed and user-code
+    # entries so modules created, moved or installed since the last request are found
+    for key, spec in list(MANAGER._mod_file_cache.items()):
+        if isinstance(spec, AstroidBuildingError) or (spec.location and not spec.location.startswith(cached_roots)):
+            del MANAGER._mod_file_cache[key]
+    # The finders memoize "not found" results as well
+    astroid_spec._find_spec.cache_clear()
+    for finder in astroid_spec._SPEC_FINDERS:
+        finder.find_module.cache_clear()
+
+
+respond({"ready": True})
+for line in requests:
+    request = json.loads(line)
+    if "code" in request:
+        # --from-stdin reads sys.stdin, so hand pylint the source instead of the request pipe
+        sys.stdin = io.TextIOWrapper(io.BytesIO(request["code"].encode("utf-8")), encoding="utf-8")
+        target = ["--from-stdin", request["name"]]
+    else:
+        target = [request["path"]]
+    forget_user_modules()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            run = Run(args + target, reporter=TextReporter(output), exit=False)
+            returncode = run.linter.msg_status
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+            returncode = 1
+    sys.stdin = requests
+    respond({"returncode": returncode, "output": output.getvalue()})
+"""
+
+
+class PersistentPylintWorker:
+    """Long-lived pylint process that keeps its imports warm across lint requests"""
+
+    def __init__(self, args: List[str]):
+        self.args = args
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._available = True
+
+    def _ensure_started(self) -> bool:
+        if self._proc is not None and self._proc.poll() is None:
+            return True
+        if not self._available:
+            return False
+
+        self._proc = subprocess.Popen(
+            [sys.executable, "-c", _PYLINT_WORKER_SCRIPT, json.dumps(self.args)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        try:
+            ready = json.loads(self._proc.stdout.readline()).get("ready")
+        except (ValueError, AttributeError):
+            ready = False
+        if not ready:
+            # pylint is not importable from this interpreter; stop retrying
+            self._stop()
+            self._available = False
+            return False
+        return True
+
+    def _stop(self):
+        if self._proc is None:
+            return
+        self._proc.kill()
+        self._proc.wait()
+        self._proc = None
+
+    def lint(self, filepath: str) -> Optional[Tuple[int, str]]:
+        """
+        Lint a file in the worker process.
+
+        Returns:
+            (returncode, output), or None if the worker is unavailable.
+        """
+        return self._request({"path": filepath})
+
+    def lint_code(self, code: str, fake_name: str) -> Optional[Tuple[int, str]]:
+        """
+        Lint source code in the worker process, reporting it under fake_name.
+
+        Returns:
+            (returncode, output), or None if the worker is unavailable.
+        """
+        return self._request({"code": code, "name": fake_name})
+
+    def _request(self, request: Dict[str, str]) -> Optional[Tuple[int, str]]:
+        with self._lock:
+            try:
+                if not self._ensure_started():
+                    return None
+                self._proc.stdin.write(json.dumps(request) + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+                if not line:
+                    raise EOFError("pylint worker exited")
+                response = json.loads(line)
+                return response["returncode"], response["output"]
+            except (OSError, ValueError, EOFError, KeyError, TypeError):
+                self._stop()
+                return None
+
 
 class ExternalLinter:
     """Generic CLI-based linter"""
 
-    def __init__(self, name: str, command: List[str]):
+    def __init__(
+        self,
+        name: str,
+        command: List[str],
+        worker: Optional[PersistentPylintWorker] = None,
+        stdin_args: Optional[List[str]] = None,
+    ):
         self.name = name
         self.command = command
+        self.worker = worker
+        # Arguments that make the linter read source from stdin, followed by a display filename
+        self.stdin_args = stdin_args
 
-    def run(self, filepath: str) -> Dict[str, Any]:
-        try:
-            result = subprocess.run(
-                self.command + [filepath],
-                capture_output=True,
-                text=True,
-            )
+    @property
+    def supports_stdin(self) -> bool:
+        return self.stdin_args is not None
 
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "issues": [],
-                    "message": f"No issues found by {self.name}",
-                }
+    @staticmethod
+    def _issues(lines: Iterable[str]) -> List[str]:
+        return [line.rstrip() for line in lines if line.strip()]
 
-            output = (result.stdout + result.stderr).strip()
+    def _result(self, returncode: int, issues: List[str]) -> Dict[str, Any]:
+        if returncode == 0:
             return {
-                "success": False,
-                "issues": output.splitlines(),
-                "message": f"{self.name} found issues",
+                "success": True,
+                "issues": [],
+                "message": f"No issues found by {self.name}",
             }
 
+        return {
+            "success": False,
+            "issues": issues,
+            "message": f"{self.name} found issues",
+        }
+
+    @staticmethod
+    def _feed_stdin(pipe: TextIO, data: str):
+        # Written from a separate thread so a linter that emits output before
+        # draining its stdin cannot deadlock against our reads
+        try:
+            try:
+                pipe.write(data)
+            finally:
+                pipe.close()
+        except (OSError, ValueError):
+            # The linter exited without reading all of its input
+            pass
+
+    def _run_command(
+        self,
+        command: List[str],
+        stdin: Optional[str] = None,
+        on_start: Optional[ProcessCallback] = None,
+    ) -> Dict[str, Any]:
+        try:
+            # subprocess only takes the posix_spawn() path for an executable given with a
+            # directory and close_fds=False; our own fds are non-inheritable (PEP 446)
+            with subprocess.Popen(
+                command,
+                executable=shutil.which(command[0]) or command[0],
+                stdin=subprocess.DEVNULL if stdin is None else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                close_fds=False,
+            ) as proc:
+                if on_start is not None:
+                    on_start(proc)
+                feeder = None
+                if stdin is not None:
+                    feeder = threading.Thread(target=self._feed_stdin, args=(proc.stdin, stdin), daemon=True)
+                    feeder.start()
+                # Stream lines as the linter produces them instead of buffering all output
+                issues = self._issues(proc.stdout)
+                returncode = proc.wait()
+                if feeder is not None:
+                    # Popen.__exit__ closes stdin too; don't race the feeder on it
+                    feeder.join()
+            return self._result(returncode, issues)
+
         except Exception as e:
             return {
                 "success": False,
@@ -53,33 +268,103 @@ class ExternalLinter:
                 "message": f"Error running {self.name}: {str(e)}",
             }
 
+    def run(self, filepath: str, on_start: Optional[ProcessCallback] = None) -> Dict[str, Any]:
+        if self.worker is not None:
+            response = self.worker.lint(filepath)
+            if response is not None:
+                returncode, output = response
+                return self._result(returncode, self._issues(output.splitlines()))
+
+        return self._run_command(self.command + [filepath], on_start=on_start)
+
+    def run_stdin(self, code: str, fake_name: str, on_start: Optional[ProcessCallback] = None) -> Dict[str, Any]:
+        """Lint source piped on stdin, reporting it under fake_name."""
+        if self.worker is not None:
+            response = self.worker.lint_code(code, fake_name)
+            if response is not None:
+                returncode, output = response
+                return self._result(returncode, self._issues(output.splitlines()))
+
+        return self._run_command(self.command + self.stdin_args + [fake_name], stdin=code, on_start=on_start)
+
 
 class CodeLintService:
     """Core lint service"""
 
     def __init__(self):
         self.linters: Dict[str, ExternalLinter] = {
-            "pylint": ExternalLinter("pylint", ["pylint", "-E"]),
+            "pylint": ExternalLinter(
+                "pylint",
+                ["pylint", "-E"],
+                worker=PersistentPylintWorker(["-E"]),
+                stdin_args=["--from-stdin"],
+            ),
         }
 
-    def lint_file(self, filepath: str, linters: Optional[List[str]] = None) -> Dict[str, Any]:
-        if not os.path.exists(filepath):
-            return {"success": False, "message": f"File not found: {filepath}"}
-
-        linters = linters or list(self.linters.keys())
+    def _run_linters(
+        self,
+        linters: List[str],
+        run: Callable[[ExternalLinter, ProcessCallback], Dict[str, Any]],
+        fail_fast: bool = False,
+    ) -> Dict[str, Any]:
         results = {}
 
+        known = []
         for name in linters:
-            linter = self.linters.get(name)
-            if not linter:
+            if name not in self.linters:
                 results[name] = {
                     "success": False,
                     "message": f"Unknown linter: {name}",
                 }
                 continue
+            known.append(name)
+
+        # Linters are independent subprocesses, so run them side by side. With fail_fast,
+        # an unknown linter has already failed the request and nothing else needs to run.
+        if known and not (fail_fast and results):
+            cancelled = threading.Event()
+            running: List[subprocess.Popen] = []
+            lock = threading.Lock()
+
+            def track(proc: subprocess.Popen):
+                with lock:
+                    running.append(proc)
+                    if cancelled.is_set():
+                        proc.terminate()
+
+            executor = ThreadPoolExecutor(max_workers=len(known))
+            futures = {executor.submit(run, self.linters[name], track): name for name in known}
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[futures[future]] = result
+                    if fail_fast and not result.get("success", False):
+                        with lock:
+                            cancelled.set()
+                            for proc in running:
+                                proc.terminate()
+                        break
+            finally:
+                # Abandoned linters are not waited for. Subprocess linters were terminated above, but a
+                # request already in the shared pylint worker runs to completion and holds the worker
+                # lock, so the next pylint call waits for it.
+                executor.shutdown(wait=not cancelled.is_set(), cancel_futures=True)
+
+        for name in known:
+            results.setdefault(
+                name,
+                {"success": False, "message": f"Skipped {name}: another linter failed (fail_fast)"},
+            )
+        results = {name: results[name] for name in linters}
+
+        return results
 
-            results[name] = linter.run(filepath)
+    def lint_file(self, filepath: str, linters: Optional[List[str]] = None, fail_fast: bool = False) -> Dict[str, Any]:
+        if not os.path.exists(filepath):
+            return {"success": False, "message": f"File not found: {filepath}"}
 
+        linters = linters or list(self.linters.keys())
+        results = self._run_linters(linters, lambda linter, on_start: linter.run(filepath, on_start), fail_fast)
         success = all(r.get("success", False) for r in results.values())
 
         return {
@@ -88,15 +373,34 @@ class CodeLintService:
             "message": f"Linting completed for {filepath}",
         }
 
-    def lint_code(self, code: str, linters: Optional[List[str]] = None) -> Dict[str, Any]:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(code)
-            temp_path = f.name
+    def lint_code(self, code: str, linters: Optional[List[str]] = None, fail_fast: bool = False) -> Dict[str, Any]:
+        linters = linters or list(self.linters.keys())
+
+        # Only linters that cannot read stdin need the code written to disk
+        temp_path = None
+        if any(name in self.linters and not self.linters[name].supports_stdin for name in linters):
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+                f.write(code)
+                temp_path = f.name
+
+        def run(linter: ExternalLinter, on_start: ProcessCallback) -> Dict[str, Any]:
+            if linter.supports_stdin:
+                return linter.run_stdin(code, SNIPPET_NAME, on_start)
+            return linter.run(temp_path, on_start)
 
         try:
-            return self.lint_file(temp_path, linters)
+            results = self._run_linters(linters, run, fail_fast)
         finally:
-            os.unlink(temp_path)
+            if temp_path is not None:
+                os.unlink(temp_path)
+
+        success = all(r.get("success", False) for r in results.values())
+
+        return {
+            "success": success,
+            "results": results,
+            "message": f"Linting completed for {SNIPPET_NAME}",
+        }
 
     def add_linter(self, name: str, command: List[str]):
         self.linters[name] = ExternalLinter(name, command)
@@ -111,33 +415,37 @@ service = CodeLintService()
 
 
 @mcp.tool()
-def lint_python_file(filepath: str, linters: Optional[List[str]] = None) -> Dict[str, Any]:
+def lint_python_file(filepath: str, linters: Optional[List[str]] = None, fail_fast: bool = False) -> Dict[str, Any]:
     """
     Lint a Python file by absolute file path.
 
     Args:
         filepath: Absolute path to the Python file.
         linters: Optional list of linter names to run.
+        fail_fast: Stop the remaining linters as soon as one reports issues. The built-in
+            pylint linter is not interrupted, so this saves no time when pylint is the slow one.
 
     Returns:
         Linting results as a dictionary.
     """
-    return service.lint_file(filepath, linters)
+    return service.lint_file(filepath, linters, fail_fast)
 
 
 @mcp.tool()
-def lint_python_code(code: str, linters: Optional[List[str]] = None) -> Dict[str, Any]:
+def lint_python_code(code: str, linters: Optional[List[str]] = None, fail_fast: bool = False) -> Dict[str, Any]:
     """
     Lint Python source code provided as a string.
 
     Args:
         code: Python source code.
         linters: Optional list of linter names to run.
+        fail_fast: Stop the remaining linters as soon as one reports issues. The built-in
+            pylint linter is not interrupted, so this saves no time when pylint is the slow one.
 
     Returns:
         Linting results as a dictionary.
     """
-    return service.lint_code(code, linters)
+    return service.lint_code(code, linters, fail_fast)
 
 
 @mcp.tool()
@@ -169,11 +477,11 @@ def add_custom_linter(name: str, command: List[str]) -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # stdio transport doesn't need host/port
-    if config["transport"] == "stdio":
+    if config.transport == "stdio":
         mcp.run(transport="stdio")
     else:
         mcp.run(
-            transport=config["transport"],
-            host=config["host"],
-            port=config["port"],
+            transport=config.transport,
+            host=config.host,
+            port=config.port,
         )
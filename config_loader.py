@@ -1,30 +1,55 @@
 """
-Configuration loader for MCP servers using OmegaConf.
+Configuration loader for MCP servers using PyYAML.
 Loads server configuration from YAML files.
 """
 
+import functools
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Optional
 
-from omegaconf import OmegaConf
+import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def load_server_config(server_name: str, config_path: Optional[str] = None) -> Dict[str, Any]:
+_VALID_TRANSPORTS = frozenset({"stdio", "http", "sse", "streamable-http"})
+
+
+@dataclass(frozen=True, slots=True)
+class ServerConfig:
+    """Validated transport settings for one MCP server. host/port are None for stdio."""
+
+    transport: str = "stdio"
+    host: Optional[str] = None
+    port: Optional[int] = None
+
+
+def load_server_config(server_name: str, config_path: Optional[str] = None) -> ServerConfig:
     """
     Load configuration for a specific MCP server from YAML file.
 
+    Results are cached per (server_name, config file); call
+    load_server_config.cache_clear() to pick up edits to the file.
+
     Args:
         server_name: Name of the server (e.g., "math", "code_lint")
         config_path: Path to the YAML config file. If None, uses default path.
 
     Returns:
-        Dictionary containing server-specific configuration with validated transport.
+        ServerConfig containing server-specific configuration with validated transport.
         Note: stdio transport doesn't require host/port.
     """
     if config_path is None:
         config_path = Path(__file__).parent / "config.yaml"
-    else:
-        config_path = Path(config_path)
+
+    # Normalize so equivalent str/Path arguments share one cache entry
+    return _load_server_config(server_name, str(Path(config_path).resolve()))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_server_config(server_name: str, config_path: str) -> ServerConfig:
+    config_path = Path(config_path)
 
     # Default configuration (stdio doesn't need host/port)
     defaults = {
@@ -40,11 +65,11 @@ def load_server_config(server_name: str, config_path: Optional[str] = None) -> D
     }
 
     if not config_path.exists():
-        return {"transport": "stdio"}
+        return ServerConfig(transport="stdio")
 
     try:
-        # Load config using OmegaConf
-        cfg = OmegaConf.load(config_path)
+        with open(config_path, encoding="utf-8") as f:
+            cfg = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         # Get server-specific config or use root-level config
         if server_name in cfg:
@@ -53,26 +78,28 @@ def load_server_config(server_name: str, config_path: Optional[str] = None) -> D
             server_cfg = cfg
 
         # Merge with defaults
-        config = OmegaConf.merge(OmegaConf.create(default_config), server_cfg)
+        config = {**default_config, **server_cfg}
 
         # Validate transport (must be one of: stdio, http, sse, streamable-http)
-        valid_transports = {"stdio", "http", "sse", "streamable-http"}
         transport = config.get("transport", "stdio")
-        if transport not in valid_transports:
+        if transport not in _VALID_TRANSPORTS:
             print(f"Warning: Invalid transport '{transport}', using 'stdio'")
             transport = "stdio"
 
         # stdio doesn't need host/port
         if transport == "stdio":
-            return {"transport": "stdio"}
+            return ServerConfig(transport="stdio")
 
         # Other transports need host and port
-        return {
-            "transport": transport,
-            "host": config.get("host", "0.0.0.0"),
-            "port": config.get("port", default_port),
-        }
+        return ServerConfig(
+            transport=transport,
+            host=config.get("host", "0.0.0.0"),
+            port=config.get("port", default_port),
+        )
     except Exception as e:
         print(f"Warning: Failed to load config for {server_name} from {config_path}: {e}")
         print("Using default configuration")
-        return {"transport": "stdio"}
+        return ServerConfig(transport="stdio")
+
+
+load_server_config.cache_clear = _load_server_config.cache_clear